@@ -1,100 +1,380 @@
+import io
+import os
+import re
 import sys
-import heapq
-from collections import defaultdict
+from collections import Counter, OrderedDict, deque
+from bitarray import bitarray, decodetree
+from bitarray.util import int2ba
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QPushButton, QLabel, QVBoxLayout, QWidget,
     QTextEdit, QFileDialog, QMessageBox, QRadioButton, QButtonGroup, QGraphicsScene,
-    QGraphicsView, QGraphicsEllipseItem, QGraphicsLineItem, QGraphicsTextItem, QScrollArea
+    QGraphicsView, QGraphicsEllipseItem, QGraphicsLineItem, QGraphicsTextItem, QGraphicsItemGroup, QScrollArea
 )
-from PyQt6.QtCore import Qt, QPointF
+from functools import partial
+from PyQt6.QtCore import Qt, QPointF, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
 from PyQt6.QtGui import QPalette, QColor, QBrush, QPen, QFont
 
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # Numba is optional; without it encoding and decoding stay on bitarray's C routines
+    np = None
+    njit = None
 
-# Represents a single node in the Huffman Tree
-class HuffmanNode:
-    def __init__(self, char, freq):
-        self.char = char  # Character represented by the node
-        self.freq = freq  # Frequency of the character
-        self.left = None  # Left child of the node
-        self.right = None  # Right child of the node
+# Matches one word (a run of non-whitespace) for the live word count
+WORD_RE = re.compile(r"\S+")
 
-    # Define comparison based on frequency for heap operations
-    def __lt__(self, other):
-        return self.freq < other.freq
+# Delay after the last keystroke before the character and word counts are refreshed
+COUNT_UPDATE_DELAY_MS = 100
+
+# Number of bits resolved by a single lookup in the root decode table
+HUFFMAN_TABLE_BITS = 11
+
+
+# Child index stored in HuffmanCoding.node_left/node_right for leaves
+NO_CHILD = -1
+
+# Number of code tables HuffmanCoding keeps for reuse
+TABLE_CACHE_SIZE = 16
+
+# Number of documents whose extracted text HuffmanApp keeps for reuse
+FILE_CACHE_SIZE = 4
+
+# HuffmanCoding attributes that make up the code tables for one frequency distribution
+TABLE_ATTRIBUTES = (
+    "node_chars", "node_freqs", "node_left", "node_right", "root", "codes", "code_symbols", "code_lengths", "code_values",
+    "table_values", "table_bits", "root_bits", "kernel_tables", "_decodetree",
+)
+
+# Longest code the compiled encoder can append to its 64-bit accumulator in one step
+MAX_COMPILED_CODE_LENGTH = 55
+
+
+# Packs the codes of a Latin-1 text (one byte per character) into out, most significant bit first.
+# Returns the number of bits the codes take; bytes past the end of out are counted but not written.
+def table_encode(text, code_values, code_lengths, out):
+    acc = 0  # Accumulator holding the nacc bits not yet written to out
+    nacc = 0
+    o = 0
+    for c in text:
+        length = code_lengths[c]
+        acc = ((acc & ((1 << nacc) - 1)) << length) | code_values[c]
+        nacc += length
+        while nacc >= 8:
+            nacc -= 8
+            if o < len(out):
+                out[o] = (acc >> nacc) & 0xFF
+            o += 1
+    if nacc > 0 and o < len(out):
+        # Flush the last partial byte, padded with zeros
+        out[o] = (acc << (8 - nacc)) & 0xFF
+    return o * 8 + nacc
+
+
+# Table-driven decoder: resolves up to HUFFMAN_TABLE_BITS bits per lookup instead of one bit per step.
+# A non-negative table_bits entry is a leaf holding (symbol index, full code length); a negative one
+# links to a second-level table of width -table_bits starting at table_values[idx].
+def table_decode(data, nbits, table_values, table_bits, root_bits, out):
+    n_out = 0
+    pos = 0  # Bits of the stream consumed so far
+    byte_pos = 0
+    bitbuf = 0  # Shift register holding the next nbuf unread bits
+    nbuf = 0
+    while pos < nbits:
+        offset = 0
+        width = root_bits
+        consumed = 0  # Bits of the current code already consumed through table links
+        while True:
+            # Keep at least 56 bits of lookahead, padding with zeros past the end of the data
+            while nbuf <= 55:
+                byte = data[byte_pos] if byte_pos < len(data) else 0
+                bitbuf = ((bitbuf << 8) | byte) & 0x7FFFFFFFFFFFFFFF
+                byte_pos += 1
+                nbuf += 8
+            idx = offset + ((bitbuf >> (nbuf - width)) & ((1 << width) - 1))
+            bits = table_bits[idx]
+            if bits == 0:
+                # Unused entry (only possible with a single 1-bit code): the stream is not ours, stop decoding
+                return n_out
+            if bits > 0:
+                out[n_out] = table_values[idx]
+                n_out += 1
+                nbuf -= bits - consumed
+                pos += bits - consumed
+                break
+            # Follow the link into the next table level
+            nbuf -= width
+            pos += width
+            consumed += width
+            offset = table_values[idx]
+            width = -bits
+    return n_out
+
+
+# Compile the kernels when Numba is available
+if njit is not None:
+    table_encode = njit(cache=True)(table_encode)
+    table_decode = njit(cache=True)(table_decode)
 
 
 # Implements the Huffman Coding algorithm
 class HuffmanCoding:
     def __init__(self):
-        self.codes = {}  # Stores the binary codes for each character
-        self.reverse_mapping = {}  # Reverse mapping from codes to characters
-        self.root = None  # Root of the Huffman Tree
+        self.codes = {}  # Stores the binary codes (bitarrays) for each character
+        self.code_symbols = []  # Characters in canonical order (by code length, then character)
+        self.code_lengths = []  # Code length of each entry in code_symbols
+        self.code_values = []  # Canonical code of each entry in code_symbols, as an integer
+        self.table_values = []  # Decode table: symbol index for leaves, sub-table offset for links
+        self.table_bits = []  # Decode table: code length for leaves, negated sub-table width for links
+        self.root_bits = 0  # Width of the root decode table
+        self.kernel_tables = None  # NumPy copies of the code and decode tables for the Numba kernels
+        self._decodetree = None  # Compiled prefix tree used for decoding
+        # The Huffman Tree is stored as parallel lists indexed by node: leaves first, then merged nodes
+        self.node_chars = []  # Character of each leaf, None for merged nodes
+        self.node_freqs = []  # Frequency of each node
+        self.node_left = []  # Index of the left child, NO_CHILD for leaves
+        self.node_right = []  # Index of the right child, NO_CHILD for leaves
+        self.root = None  # Index of the root of the Huffman Tree
+        self._table_cache = OrderedDict()  # Code tables of recent texts, keyed by their frequencies
+        self.last_text_length = 0  # Number of characters in the last compressed text
+        self.last_bit_length = 0  # Number of bits in the last compressed output
+        self.last_frequency = None  # Character frequencies of the last compressed text
 
     # Builds a frequency dictionary from the input text
     def build_frequency_dict(self, text):
-        frequency = defaultdict(int)
-        for char in text:
-            frequency[char] += 1
-        return frequency
-
-    # Builds a min-heap based on character frequencies
-    def build_heap(self, frequency):
-        heap = []
-        for char, freq in frequency.items():
-            node = HuffmanNode(char, freq)
-            heapq.heappush(heap, node)
-        return heap
-
-    # Merges nodes to build the Huffman Tree
-    def merge_nodes(self, heap):
-        while len(heap) > 1:
-            node1 = heapq.heappop(heap)  # Node with the smallest frequency
-            node2 = heapq.heappop(heap)  # Node with the second smallest frequency
+        # Counter tallies the characters in C instead of one Python step per character
+        return Counter(text)
+
+    # Stores the leaves in the node lists and returns their indices sorted by frequency
+    def build_leaf_queue(self, frequency):
+        leaf_count = len(frequency)
+        node_count = 2 * leaf_count - 1  # A full binary tree with leaf_count leaves
+        self.node_chars = list(frequency) + [None] * (leaf_count - 1)
+        self.node_freqs = list(frequency.values()) + [0] * (leaf_count - 1)
+        self.node_left = [NO_CHILD] * node_count
+        self.node_right = [NO_CHILD] * node_count
+        return deque(sorted(range(leaf_count), key=self.node_freqs.__getitem__))
+
+    # Pops the node with the smallest frequency from the front of either queue
+    def pop_smallest(self, leaves, merged):
+        if not merged or (leaves and self.node_freqs[leaves[0]] <= self.node_freqs[merged[0]]):
+            return leaves.popleft()
+        return merged.popleft()
+
+    # Merges nodes to build the Huffman Tree with the two-queue method: merged nodes are created in
+    # non-decreasing frequency order, so both queues stay sorted and no heap is needed
+    def merge_nodes(self, leaves):
+        merged = deque()
+        next_index = len(leaves)  # Merged nodes are written after the leaves
+        while len(leaves) + len(merged) > 1:
+            index1 = self.pop_smallest(leaves, merged)  # Node with the smallest frequency
+            index2 = self.pop_smallest(leaves, merged)  # Node with the second smallest frequency
             # Create a new merged node
-            merged = HuffmanNode(None, node1.freq + node2.freq)
-            merged.left = node1
-            merged.right = node2
-            heapq.heappush(heap, merged)  # Push the merged node back into the heap
-        self.root = heap[0]
+            self.node_freqs[next_index] = self.node_freqs[index1] + self.node_freqs[index2]
+            self.node_left[next_index] = index1
+            self.node_right[next_index] = index2
+            merged.append(next_index)
+            next_index += 1
+        self.root = (leaves or merged)[0]
         return self.root
 
-    # Recursive helper to generate Huffman codes
-    def build_codes_helper(self, root, current_code):
-        if root is None:
-            return
-        # If a leaf node, assign the code
-        if root.char is not None:
-            self.codes[root.char] = current_code
-            self.reverse_mapping[current_code] = root.char
-        # Traverse the left and right children
-        self.build_codes_helper(root.left, current_code + "0")
-        self.build_codes_helper(root.right, current_code + "1")
+    # Collects the code length (leaf depth) of each character with an explicit stack instead of recursion
+    def build_codes_helper(self, root, lengths):
+        stack = [(root, 0)]
+        while stack:
+            index, depth = stack.pop()
+            # If a leaf node, its depth is the length of its code
+            if self.node_left[index] == NO_CHILD:
+                lengths[self.node_chars[index]] = depth
+                continue
+            # Traverse the left and right children
+            stack.append((self.node_right[index], depth + 1))
+            stack.append((self.node_left[index], depth + 1))
+
+    # Assigns canonical Huffman codes from the code lengths alone
+    def build_canonical_codes(self, lengths):
+        self.code_symbols = sorted(lengths, key=lambda char: (lengths[char], char))
+        self.code_lengths = [lengths[char] for char in self.code_symbols]
+        self.code_values = []
+        self.codes = {}
+        code = 0
+        prev_length = self.code_lengths[0] if self.code_lengths else 0
+        for char, length in zip(self.code_symbols, self.code_lengths):
+            # Codes of the same length are consecutive; a longer length shifts the counter left
+            code <<= length - prev_length
+            prev_length = length
+            self.code_values.append(code)
+            self.codes[char] = int2ba(code, length)
+            code += 1
+
+    # Fills one decode table for the canonical codes in [start, end), which share their first `consumed` bits
+    def build_decode_table_helper(self, start, end, consumed, width):
+        offset = len(self.table_values)
+        self.table_values.extend([0] * (1 << width))
+        self.table_bits.extend([0] * (1 << width))
+        i = start
+        while i < end:
+            length = self.code_lengths[i]
+            code = self.code_values[i]
+            remaining = length - consumed
+            if remaining <= width:
+                # Short code: replicate the leaf over every index that starts with its remaining bits
+                base = offset + ((code & ((1 << remaining) - 1)) << (width - remaining))
+                for idx in range(base, base + (1 << (width - remaining))):
+                    self.table_values[idx] = i
+                    self.table_bits[idx] = length
+                i += 1
+                continue
+            # Long code: every code sharing the next `width` bits goes into one sub-table
+            prefix = code >> (remaining - width)
+            j = i + 1
+            while j < end and self.code_values[j] >> (self.code_lengths[j] - consumed - width) == prefix:
+                j += 1
+            # Codes are sorted by length, so the last one in the group is the longest
+            sub_width = min(self.code_lengths[j - 1] - consumed - width, HUFFMAN_TABLE_BITS)
+            idx = offset + (prefix & ((1 << width) - 1))
+            self.table_values[idx] = self.build_decode_table_helper(i, j, consumed + width, sub_width)
+            self.table_bits[idx] = -sub_width
+            i = j
+        return offset
+
+    # Builds the lookup tables used by table_decode from the canonical codes
+    def build_decode_table(self):
+        self.table_values = []
+        self.table_bits = []
+        self.root_bits = min(max(self.code_lengths, default=0), HUFFMAN_TABLE_BITS)
+        self.build_decode_table_helper(0, len(self.code_symbols), 0, self.root_bits)
 
     # Generates Huffman codes for all characters
     def build_codes(self, root):
-        self.build_codes_helper(root, "")
+        lengths = {}
+        if len(self.node_chars) == 1:
+            # A lone character is the root itself; give it a 1-bit code, as a 0-bit code would encode to nothing
+            lengths[self.node_chars[0]] = 1
+        else:
+            self.build_codes_helper(root, lengths)
+        self.build_canonical_codes(lengths)
+        self.build_decode_table()
+        self.build_kernel_tables()
+        # Compile the codes into a prefix tree (raises ValueError if not prefix-free)
+        self._decodetree = decodetree(self.codes)
+
+    # Restores the code tables for this frequency distribution, building and caching them on a miss
+    def load_tables(self, frequency):
+        key = frozenset(frequency.items())
+        tables = self._table_cache.get(key)
+        if tables is not None:
+            self._table_cache.move_to_end(key)
+            for name, value in zip(TABLE_ATTRIBUTES, tables):
+                setattr(self, name, value)
+            return
+        leaves = self.build_leaf_queue(frequency)
+        root = self.merge_nodes(leaves)
+        self.build_codes(root)
+        self._table_cache[key] = tuple(getattr(self, name) for name in TABLE_ATTRIBUTES)
+        if len(self._table_cache) > TABLE_CACHE_SIZE:
+            self._table_cache.popitem(last=False)  # Evict the least recently used tables
 
-    # Compresses the input text into a binary string
+    # Compresses the input text into a bitarray; the frequencies it counts are kept in last_frequency
     def compress(self, text):
+        # Check before any state changes so the tables of the previous text stay usable
+        if not text:
+            raise ValueError("There is no text to compress")
         frequency = self.build_frequency_dict(text)
-        heap = self.build_heap(frequency)
-        root = self.merge_nodes(heap)
-        self.build_codes(root)
-        # Encode the text
-        encoded_text = "".join(self.codes[char] for char in text)
+        self.last_frequency = frequency
+        self.load_tables(frequency)
+        # The output size follows from the frequencies alone, so remember it for the compression ratio
+        self.last_text_length = len(text)
+        self.last_bit_length = sum(freq * len(self.codes[char]) for char, freq in frequency.items())
+        if self.can_use_compiled_kernels():
+            return self.compiled_compress(text)
+        # Encode the whole text in a single call to bitarray's C encoder
+        encoded_text = bitarray()
+        encoded_text.encode(self.codes, text)
         return encoded_text
 
-    # Decompresses a binary string into the original text
+    # Decompresses a bitarray into the original text
     def decompress(self, encoded_text):
-        current_code = ""
-        decoded_text = ""
-        # Map binary codes back to characters
-        for bit in encoded_text:
-            current_code += bit
-            if current_code in self.reverse_mapping:
-                decoded_text += self.reverse_mapping[current_code]
-                current_code = ""
-        return decoded_text
+        if self.can_use_compiled_kernels():
+            return self.compiled_decompress(encoded_text)
+        # Walk the compiled prefix tree in C rather than matching codes bit by bit
+        return "".join(encoded_text.decode(self._decodetree))
+
+    # Precomputes byte-indexed arrays for the Numba kernels once per code table.
+    # The kernels work on one byte per character, so they are only set up for a Latin-1 alphabet.
+    def build_kernel_tables(self):
+        self.kernel_tables = None
+        if (
+            njit is None
+            or not self.code_symbols
+            or self.code_lengths[-1] > MAX_COMPILED_CODE_LENGTH
+            or any(ord(char) > 255 for char in self.code_symbols)
+        ):
+            return
+        code_values = np.zeros(256, dtype=np.int64)
+        code_lengths = np.zeros(256, dtype=np.int64)
+        symbols = np.array([ord(char) for char in self.code_symbols], dtype=np.uint8)
+        code_values[symbols] = self.code_values
+        code_lengths[symbols] = self.code_lengths
+        self.kernel_tables = (
+            code_values, code_lengths, symbols,
+            np.array(self.table_values, dtype=np.int64), np.array(self.table_bits, dtype=np.int64),
+        )
+
+    # Whether compress and decompress can run on the compiled kernels
+    def can_use_compiled_kernels(self):
+        return self.kernel_tables is not None
+
+    # Encodes a Latin-1 text with the compiled table_encode kernel
+    def compiled_compress(self, text):
+        code_values, code_lengths, _, _, _ = self.kernel_tables
+        data = np.frombuffer(text.encode("latin-1"), dtype=np.uint8)
+        # Size the output exactly and let the kernel write straight into the bitarray's buffer
+        encoded_text = bitarray(self.last_bit_length)
+        nbits = table_encode(data, code_values, code_lengths, np.frombuffer(encoded_text, dtype=np.uint8))
+        if nbits != self.last_bit_length:
+            raise RuntimeError(f"Encoded {nbits} bits, expected {self.last_bit_length}")
+        return encoded_text
+
+    # Decodes a bitarray with the compiled table_decode kernel
+    def compiled_decompress(self, encoded_text):
+        _, _, symbols, table_values, table_bits = self.kernel_tables
+        data = np.frombuffer(encoded_text, dtype=np.uint8)  # Shares the bitarray's buffer, no copy
+        # Every code is at least code_lengths[0] bits long, which bounds the number of characters
+        out = np.empty(len(encoded_text) // self.code_lengths[0] + 1, dtype=np.int64)
+        n_out = table_decode(data, len(encoded_text), table_values, table_bits, self.root_bits, out)
+        return symbols[out[:n_out]].tobytes().decode("latin-1")
+
+
+# Number of leading bits/characters shown for the compressed and decompressed output
+PREVIEW_LENGTH = 50
+
+
+# Signals used by CompressWorker to hand its results back to the GUI thread
+class CompressWorkerSignals(QObject):
+    finished = pyqtSignal(object, str, str)  # Frequencies, encoded preview, decoded preview
+    error = pyqtSignal(str)
+
+
+# Loads the text and runs compression on a thread-pool thread so the GUI stays responsive
+class CompressWorker(QRunnable):
+    def __init__(self, huffman, load_text):
+        super().__init__()
+        self.huffman = huffman  # HuffmanCoding instance to compress with
+        self.load_text = load_text  # Callable returning the text to compress (may parse a file)
+        self.signals = CompressWorkerSignals()
+
+    def run(self):
+        try:
+            text = self.load_text()
+            encoded = self.huffman.compress(text)
+            frequency = self.huffman.last_frequency  # Reuse the count compress already made
+            decoded = self.huffman.decompress(encoded)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+        # Only the previews cross to the GUI thread; slice the bitarray before converting it to text
+        self.signals.finished.emit(frequency, encoded[:PREVIEW_LENGTH].to01(), decoded[:PREVIEW_LENGTH])
 
 
 # Main GUI Application Class
@@ -178,7 +458,16 @@ class HuffmanApp(QMainWindow):
         self.compression_ratio_button.clicked.connect(self.show_compression_ratio)
         self.text_input.textChanged.connect(self.update_counts)
 
+        # Coalesces bursts of keystrokes into a single count refresh
+        self.count_timer = QTimer(self)
+        self.count_timer.setSingleShot(True)
+        self.count_timer.setInterval(COUNT_UPDATE_DELAY_MS)
+        self.count_timer.timeout.connect(self.refresh_counts)
+
         self.tree_window = None  # Placeholder for the Huffman Tree display window
+        self.worker = None  # Compression currently running on the thread pool, if any
+        self.file_cache = OrderedDict()  # (modification time, extracted text) of recent documents, keyed by path
+        self.displayed_frequency = None  # Frequencies currently shown in frequency_label
 
     # Handles compression when "Compress" button is clicked
     def handle_compression(self):
@@ -187,12 +476,7 @@ class HuffmanApp(QMainWindow):
             if not text:
                 QMessageBox.warning(self, "Warning", "Text input cannot be empty!")
                 return
-            frequency = self.huffman.build_frequency_dict(text)
-            self.display_frequencies(frequency)
-
-            encoded = self.huffman.compress(text)
-            decoded = self.huffman.decompress(encoded)
-            self.result_label.setText(f"Compressed: {encoded[:50]}...\nDecompressed: {decoded}")
+            self.start_worker(lambda: text)
         else:
             QMessageBox.warning(self, "Warning", "Use the file selection button to compress a document!")
 
@@ -202,59 +486,107 @@ class HuffmanApp(QMainWindow):
         file_path, _ = QFileDialog.getOpenFileName(self, "Open File", "", file_filter)
 
         if file_path:
-            try:
-                text = self.read_file_content(file_path)
-                frequency = self.huffman.build_frequency_dict(text)
-                self.display_frequencies(frequency)
-
-                encoded = self.huffman.compress(text)
-                decoded = self.huffman.decompress(encoded)
-                self.result_label.setText(f"Compressed: {encoded[:50]}...\nDecompressed: {decoded[:50]}...")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to process file: {str(e)}")
+            self.start_worker(partial(self.read_file_content, file_path), error_prefix="Failed to process file: ")
+
+    # Runs a CompressWorker on the global thread pool, disabling the buttons until it reports back
+    def start_worker(self, load_text, error_prefix=""):
+        self.worker = CompressWorker(self.huffman, load_text)
+        self.worker.signals.finished.connect(self.show_compression_result)
+        self.worker.signals.error.connect(
+            lambda message: QMessageBox.critical(self, "Error", f"{error_prefix}{message}")
+        )
+        self.worker.signals.finished.connect(self.finish_worker)
+        self.worker.signals.error.connect(self.finish_worker)
+        self.set_buttons_enabled(False)
+        QThreadPool.globalInstance().start(self.worker)
+
+    # Re-enables the buttons once the background compression is done
+    def finish_worker(self):
+        self.worker = None
+        self.set_buttons_enabled(True)
+
+    # Enables or disables every button that reads or replaces the Huffman state
+    def set_buttons_enabled(self, enabled):
+        for button in (
+            self.compress_button, self.file_button, self.show_tree_button,
+            self.new_compression_button, self.compression_ratio_button
+        ):
+            button.setEnabled(enabled)
+
+    # Shows the frequencies and the compressed/decompressed previews produced by a CompressWorker
+    def show_compression_result(self, frequency, encoded_preview, decoded_preview):
+        self.display_frequencies(frequency)
+        self.result_label.setText(f"Compressed: {encoded_preview}...\nDecompressed: {decoded_preview}...")
 
     # Displays the character frequencies in the GUI
     def display_frequencies(self, frequency):
-        freq_str = "\n".join(f"'{repr(char)}': {freq}" for char, freq in sorted(frequency.items()))
-        self.frequency_label.setText(f"Character Frequencies:\n{freq_str}")
-
-    # Reads content from supported file formats
+        # Skip the sort and re-render when the same frequencies are already shown
+        if frequency == self.displayed_frequency:
+            return
+        self.displayed_frequency = frequency
+        buffer = io.StringIO()
+        buffer.write("Character Frequencies:\n")
+        for char, freq in sorted(frequency.items()):
+            buffer.write(f"'{char!r}': {freq}\n")
+        self.frequency_label.setText(buffer.getvalue().rstrip("\n"))
+
+    # Reads content from supported file formats, reusing the text of files that have not changed since
     def read_file_content(self, file_path):
-        import os
-        from PyPDF2 import PdfReader
-        from docx import Document
-
+        mtime = os.path.getmtime(file_path)
+        cached = self.file_cache.get(file_path)
+        if cached is not None and cached[0] == mtime:
+            self.file_cache.move_to_end(file_path)
+            return cached[1]
+        text = self.parse_file_content(file_path)
+        # Replaces any text extracted from an older version of the same file
+        self.file_cache[file_path] = (mtime, text)
+        self.file_cache.move_to_end(file_path)
+        if len(self.file_cache) > FILE_CACHE_SIZE:
+            self.file_cache.popitem(last=False)  # Evict the least recently used document
+        return text
+
+    # Extracts the text of a document; each reader library is only imported for its own format
+    def parse_file_content(self, file_path):
         _, ext = os.path.splitext(file_path)
         if ext == ".pdf":
+            from PyPDF2 import PdfReader
+
             reader = PdfReader(file_path)
-            return " ".join(page.extract_text() for page in reader.pages)
+            return " ".join([page.extract_text() for page in reader.pages])
         elif ext == ".docx":
+            from docx import Document
+
             doc = Document(file_path)
-            return "\n".join(para.text for para in doc.paragraphs)
+            return "\n".join([para.text for para in doc.paragraphs])
         elif ext == ".odf":
             from odf.opendocument import load
             from odf.text import P
 
             doc = load(file_path)
-            return "\n".join(p.text for p in doc.getElementsByType(P))
+            return "\n".join([p.text for p in doc.getElementsByType(P)])
         else:
             raise ValueError("Unsupported file type")
 
     # Displays the Huffman Tree in a separate window
     def show_huffman_tree(self):
-        if not self.huffman.root:
+        if self.huffman.root is None:
             QMessageBox.warning(self, "Warning", "No Huffman tree to display! Compress text first.")
             return
 
         if not self.tree_window:
-            self.tree_window = HuffmanTreeWindow(self.huffman.root)
+            self.tree_window = HuffmanTreeWindow(self.huffman)
         self.tree_window.show()
 
-    # Updates the character and word counts as the user types
+    # Schedules a count refresh as the user types; each keystroke restarts the timer
     def update_counts(self):
+        self.count_timer.start()
+
+    # Updates the character and word counts
+    def refresh_counts(self):
         text = self.text_input.toPlainText()
         self.character_count_label.setText(f"Character Count: {len(text)}")
-        word_count = len(text.split())
+        # Count the matches without building a list of every word
+        word_count = sum(1 for _ in WORD_RE.finditer(text))
         self.word_count_label.setText(f"Word Count: {word_count}")
 
     # Resets the application for a new compression
@@ -263,6 +595,7 @@ class HuffmanApp(QMainWindow):
         self.character_count_label.setText("Character Count: 0")  # Reset character count
         self.word_count_label.setText("Word Count: 0")  # Reset word count
         self.frequency_label.setText("Character Frequencies:\n")  # Clear frequency display
+        self.displayed_frequency = None
         self.result_label.setText("Result: ")  # Clear result display
         self.huffman = HuffmanCoding()  # Reset HuffmanCoding instance
         if self.tree_window:
@@ -278,23 +611,11 @@ class HuffmanApp(QMainWindow):
             QMessageBox.warning(self, "Warning", "No compressed data available! Compress text first.")
             return
 
-        # Get the original text
-        if self.radio_text.isChecked():
-            text = self.text_input.toPlainText()
-        else:
-            QMessageBox.warning(self, "Warning", "Compression ratio is only available for text input.")
-            return
-
-        if not text:
-            QMessageBox.warning(self, "Warning", "Text input is empty!")
-            return
-
         # Calculate the size of the original text in bits (assuming 8 bits per character)
-        original_size = len(text) * 8
+        original_size = self.huffman.last_text_length * 8
 
-        # Calculate the size of the compressed data in bits
-        compressed_text = self.huffman.compress(text)
-        compressed_size = len(compressed_text)  # Each '0' or '1' is 1 bit
+        # Reuse the size recorded by the last compression instead of encoding the text again
+        compressed_size = self.huffman.last_bit_length
 
         # Calculate the compression ratio
         compression_ratio = compressed_size / original_size
@@ -311,7 +632,7 @@ class HuffmanApp(QMainWindow):
 
 # Window for visualizing the Huffman Tree
 class HuffmanTreeWindow(QWidget):
-    def __init__(self, root):
+    def __init__(self, huffman):
         super().__init__()
         self.setWindowTitle("Huffman Tree")
         self.resize(800, 600)
@@ -326,7 +647,7 @@ class HuffmanTreeWindow(QWidget):
         self.set_colors_based_on_theme()
 
         # Draw the Huffman Tree
-        self.draw_tree(root, QPointF(400, 50), 200)
+        self.draw_tree(huffman, QPointF(400, 50), 200)
 
     def set_colors_based_on_theme(self):
         """
@@ -354,36 +675,40 @@ class HuffmanTreeWindow(QWidget):
         # Set the background color of the scene
         self.scene.setBackgroundBrush(QBrush(background_color))
 
-    def draw_tree(self, node, pos, x_offset):
-        if node is None:
-            return
-
+    def draw_tree(self, huffman, pos, x_offset):
         circle_radius = 25  # Increased node size
-        ellipse = QGraphicsEllipseItem(pos.x() - circle_radius, pos.y() - circle_radius, 2 * circle_radius, 2 * circle_radius)
-        ellipse.setBrush(QBrush(self.node_color))  # Use dynamic node color
-        ellipse.setPen(QPen(self.node_border_color, 2))  # Add border to nodes
-        self.scene.addItem(ellipse)
-
-        label = repr(node.char) if node.char else '␀'  # Show character or null for merged nodes
-        text = QGraphicsTextItem(f"{label}\n{node.freq}")
-        text.setDefaultTextColor((self.text_color))  # Use dynamic text color
-        text.setFont(QFont("Monospace", 10))  # Use a monospaced font
-        text.setPos(pos.x() - 15, pos.y() - 15)
-        self.scene.addItem(text)
-
-        # Draw left child
-        if node.left:
-            left_pos = QPointF(pos.x() - x_offset, pos.y() + 100)  # Increased vertical spacing
-            line = self.scene.addLine(pos.x(), pos.y() + circle_radius, left_pos.x(), left_pos.y() - circle_radius)
-            line.setPen(QPen(self.edge_color, 2))  # Use dynamic edge color
-            self.draw_tree(node.left, left_pos, x_offset / 1.5)
-
-        # Draw right child
-        if node.right:
-            right_pos = QPointF(pos.x() + x_offset, pos.y() + 100)  # Increased vertical spacing
-            line = self.scene.addLine(pos.x(), pos.y() + circle_radius, right_pos.x(), right_pos.y() - circle_radius)
-            line.setPen(QPen(self.edge_color, 2))  # Use dynamic edge color
-            self.draw_tree(node.right, right_pos, x_offset / 1.5)
+        # Collect every item in one group and walk the tree with an explicit stack instead of recursion
+        group = QGraphicsItemGroup()
+        stack = [(huffman.root, pos, x_offset)]
+        while stack:
+            index, pos, x_offset = stack.pop()
+
+            ellipse = QGraphicsEllipseItem(pos.x() - circle_radius, pos.y() - circle_radius, 2 * circle_radius, 2 * circle_radius)
+            ellipse.setBrush(QBrush(self.node_color))  # Use dynamic node color
+            ellipse.setPen(QPen(self.node_border_color, 2))  # Add border to nodes
+            group.addToGroup(ellipse)
+
+            char = huffman.node_chars[index]
+            label = repr(char) if char else '␀'  # Show character or null for merged nodes
+            text = QGraphicsTextItem(f"{label}\n{huffman.node_freqs[index]}")
+            text.setDefaultTextColor((self.text_color))  # Use dynamic text color
+            text.setFont(QFont("Monospace", 10))  # Use a monospaced font
+            text.setPos(pos.x() - 15, pos.y() - 15)
+            group.addToGroup(text)
+
+            # Draw the edges to the right and left children, then visit the left child first
+            for child, direction in ((huffman.node_right[index], 1), (huffman.node_left[index], -1)):
+                if child != NO_CHILD:
+                    child_pos = QPointF(pos.x() + direction * x_offset, pos.y() + 100)  # Increased vertical spacing
+                    line = QGraphicsLineItem(pos.x(), pos.y() + circle_radius, child_pos.x(), child_pos.y() - circle_radius)
+                    line.setPen(QPen(self.edge_color, 2))  # Use dynamic edge color
+                    group.addToGroup(line)
+                    stack.append((child, child_pos, x_offset / 1.5))
+
+        # Insert the whole tree at once without maintaining the scene index, then index it a single time
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+        self.scene.addItem(group)
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.BspTreeIndex)
 
 
 # Entry point for the application